@@ -69,6 +69,17 @@ compute_lintransform(
     const coord_t out,
     lintransform_t* coeffs);
 
+/**
+Returns non-zero if the given coefficients describe the identity
+transformation, i.e. applying them would not change the coordinates.
+*/
+static inline int
+lintransform_is_identity(
+    const lintransform_t* const coeffs) {
+    return (coeffs->a == 1.0 && coeffs->b == 0.0 && coeffs->c == 0.0 &&
+            coeffs->d == 0.0 && coeffs->e == 1.0 && coeffs->f == 0.0);
+}
+
 /**
 Apply a linear transformation to a list of coordinates.
 
@@ -59,13 +59,14 @@ bbox_print(
         const bbox_t* const bbox);
 
 /**
-Check that the bbox is valid, that is min <= max
+Check that the bbox is valid, that is min <= max.  Unset (NaN) sides
+are always valid.
 */
 static inline int
 bbox_is_valid(
     const bbox_t* const b) {
-    return (b->min.x <= b->max.x &&
-            b->min.y <= b->max.y);
+    return (!(b->min.x > b->max.x) &&
+            !(b->min.y > b->max.y));
 }
 
 /**
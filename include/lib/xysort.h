@@ -40,7 +40,8 @@ DAMAGE.
 #include "lib/util.h"
 
 /*
-Sorts coordinates by (y, x).
+Sorts coordinates by (y, x).  The sort is stable: identical
+coordinates keep their original order.
 
 Returns a list of sorted pointers to coordinates.
 
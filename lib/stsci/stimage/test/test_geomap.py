@@ -28,6 +28,7 @@
 # DAMAGE.
 
 import numpy as np
+import pytest
 import stsci.stimage as stimage
 
 # def test_same():
@@ -42,5 +43,87 @@ import stsci.stimage as stimage
 
 #     assert False
 
+def test_result_object():
+    np.random.seed(0)
+    x = np.random.random((64, 2))
+    y = x + 1.0
+
+    fit, output = stimage.geomap(x, y, fit_geometry='shift',
+                                 function='polynomial')
+
+    assert len(output) == 64
+    for name in output.dtype.names:
+        assert np.all(np.isfinite(output[name]))
+    assert np.allclose(output['resid_x'], output['input_x'] - output['fit_x'])
+    assert np.allclose(output['resid_y'], output['input_y'] - output['fit_y'])
+
+    assert fit.shift.shape == (2,)
+    assert fit.rms.shape == (2,)
+
+    # The input is the reference shifted by -1 in both axes
+    assert np.allclose(fit.shift, [-1.0, -1.0])
+    assert np.allclose(fit.xcoeff, [-1.0, 1.0, 0.0])
+    assert np.allclose(fit.ycoeff, [-1.0, 0.0, 1.0])
+    assert np.allclose(fit.rms, 0.0)
+    assert np.allclose(output['fit_x'], output['input_x'])
+    assert np.allclose(output['fit_y'], output['input_y'])
+    assert np.allclose(output['resid_x'], 0.0)
+    assert np.allclose(output['resid_y'], 0.0)
+
+def test_rotate():
+    np.random.seed(0)
+    ref = np.random.random((64, 2)) * 100.0
+    theta = np.deg2rad(5.0)
+    c, s = np.cos(theta), np.sin(theta)
+    input = np.column_stack([3.0 + c * ref[:, 0] - s * ref[:, 1],
+                             -2.0 + s * ref[:, 0] + c * ref[:, 1]])
+
+    fit, output = stimage.geomap(input, ref, fit_geometry='rotate',
+                                 function='polynomial')
+
+    assert np.allclose(fit.xcoeff, [3.0, c, -s])
+    assert np.allclose(fit.ycoeff, [-2.0, s, c])
+    assert np.allclose(fit.shift, [3.0, -2.0])
+    assert np.allclose(fit.rotation, [355.0, 355.0])
+    assert np.allclose(output['resid_x'], 0.0, atol=1e-10)
+    assert np.allclose(output['resid_y'], 0.0, atol=1e-10)
+
+def test_reject():
+    np.random.seed(0)
+    ref = np.random.random((64, 2)) * 100.0
+    input = np.column_stack([1.0 + 2.0 * ref[:, 0] + 0.1 * ref[:, 1],
+                             -1.0 + 0.2 * ref[:, 0] + 3.0 * ref[:, 1]])
+    # A single outlier, low in both axes
+    input[10] -= [50.0, 40.0]
+
+    fit, output = stimage.geomap(input, ref, fit_geometry='general',
+                                 function='polynomial', maxiter=3,
+                                 reject=3.0)
+
+    # Rejected points have no fitted value
+    rejected = ~np.isfinite(output['fit_x'])
+    assert np.flatnonzero(rejected).tolist() == [10]
+    assert np.all(np.isnan(output['fit_y'][rejected]))
+
+    assert np.allclose(fit.xcoeff, [1.0, 2.0, 0.1])
+    assert np.allclose(fit.ycoeff, [-1.0, 0.2, 3.0])
+    assert np.allclose(fit.rms, 0.0, atol=1e-10)
+    assert np.allclose(output['resid_x'][~rejected], 0.0, atol=1e-10)
+    assert np.allclose(output['resid_y'][~rejected], 0.0, atol=1e-10)
+
+def test_empty_bbox():
+    np.random.seed(0)
+    x = np.random.random((64, 2))
+
+    with pytest.raises(RuntimeError, match="within the bounding box"):
+        stimage.geomap(x, x + 1.0, bbox=[10.0, 10.0, 20.0, 20.0],
+                       fit_geometry='shift', function='polynomial')
+
+def test_empty_input():
+    x = np.zeros((0, 2))
+
+    with pytest.raises(RuntimeError, match="No coordinates to fit"):
+        stimage.geomap(x, x, fit_geometry='shift', function='polynomial')
+
 if __name__ == '__main__':
     test_same()
@@ -73,3 +73,21 @@ def test_different():
         assert r['ref_idx'][i] < 512
 
 
+def test_triangles_rotated():
+    rng = np.random.RandomState(0)
+    y = rng.random_sample((200, 2)) * 1000
+    angle = np.deg2rad(rng.uniform(-3, 3))
+    rot = np.array([[np.cos(angle), -np.sin(angle)],
+                    [np.sin(angle), np.cos(angle)]])
+    x = np.dot(y[:150], rot.T) + rng.uniform(-5, 5, 2)
+    x += rng.normal(0, 0.05, (150, 2))
+    x = np.vstack([x, rng.random_sample((50, 2)) * 1000])
+
+    r = stimage.xyxymatch(x, y, algorithm='triangles', tolerance=3.0,
+                          separation=1.0, nmatch=30,
+                          origin=(10.0, 5.0), rotation=(1.0, 1.0))
+
+    assert len(r) > 0
+    for i in range(len(r)):
+        assert r['input_idx'][i] == r['ref_idx'][i]
+        assert r['input_idx'][i] < 150
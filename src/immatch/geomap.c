@@ -39,6 +39,7 @@ DAMAGE.
 #define _USE_MATH_DEFINES       /* needed for MS Windows to define M_PI */ 
 #include <math.h>
 #include <stdio.h>
+#include <string.h>
 
 #include "immatch/geomap.h"
 #include "lib/xybbox.h"
@@ -232,7 +233,7 @@ compute_surface_coefficients(
 
  exit:
 
-    return 0;
+    return status;
 }
 
 static int
@@ -395,7 +396,7 @@ geo_fit_theta(
     for (i = 0; i < ncoord; ++i) {
         syrxi += weights[i] * (ref[i].y - r0.y) * (input[i].x - i0.x);
         sxryi += weights[i] * (ref[i].x - r0.x) * (input[i].y - i0.y);
-        sxryi += weights[i] * (ref[i].x - r0.x) * (input[i].x - i0.x);
+        sxrxi += weights[i] * (ref[i].x - r0.x) * (input[i].x - i0.x);
         syryi += weights[i] * (ref[i].y - r0.y) * (input[i].y - i0.y);
     }
 
@@ -738,7 +739,7 @@ geo_fit_linear(
     cthetac.x = xmag * ctheta;
     sthetac.x = ymag * stheta;
     sthetac.y = xmag * stheta;
-    cthetac.x = ymag * ctheta;
+    cthetac.y = ymag * ctheta;
 
     /* Compute the X and Y fit coefficients */
     if (compute_surface_coefficients(
@@ -820,8 +821,8 @@ geo_fit_xy(
         stimage_error_t* error) {
 
     bbox_t              bbox;
+    double*             z         = NULL;
     double*             zfit      = NULL;
-    const double* const z = (double*)input + (xfit ? 0 : 1);
     surface_t           savefit;
     surface_fit_error_e fit_error = surface_fit_error_ok;
     size_t              i         = 0;
@@ -843,8 +844,19 @@ geo_fit_xy(
 
     *has_secondary = 1;
 
-    zfit = malloc_with_error(ncoord * sizeof(double), error);
-    if (zfit == NULL) goto exit;
+    /* surface_fit needs the fitted axis as a contiguous vector */
+    z = malloc_with_error(ncoord * sizeof(double), error);
+    if (z == NULL) goto exit;
+    for (i = 0; i < ncoord; ++i) {
+        z[i] = xfit ? input[i].x : input[i].y;
+    }
+
+    /* The temporary fit vector is only needed for the shift geometry
+       and the higher-order fit, so don't allocate it otherwise */
+    if (fit->fit_geometry == geomap_fit_shift) {
+        zfit = malloc_with_error(ncoord * sizeof(double), error);
+        if (zfit == NULL) goto exit;
+    }
 
     bbox_copy(&fit->bbox, &bbox);
     bbox_make_nonsingular(&bbox);
@@ -860,7 +872,7 @@ geo_fit_xy(
                         sf1, fit->function, 1, 1, xterms_none, &bbox,
                         error)) goto exit;
             for (i = 0; i < ncoord; ++i) {
-                zfit[i] = z[i<<1] - ref[i].x;
+                zfit[i] = z[i] - ref[i].x;
             }
 
             if (surface_fit(
@@ -903,7 +915,7 @@ geo_fit_xy(
                 fit->xxterms == xterms_full) {
                 if (surface_init(
                             sf2, fit->function, fit->xxorder, fit->xyorder,
-                            fit->xxterms, &fit->bbox, error)) {
+                            fit->xxterms, &bbox, error)) {
                     surface_free(sf1);
                     goto exit;
                 }
@@ -923,7 +935,7 @@ geo_fit_xy(
                         sf1, fit->function, 1, 1, xterms_none, &bbox,
                         error)) goto exit;
             for (i = 0; i < ncoord; ++i) {
-                zfit[i] = z[i<<1] - ref[i].y;
+                zfit[i] = z[i] - ref[i].y;
             }
             if (surface_fit(
                         sf1, ncoord, ref, zfit, weights,
@@ -978,11 +990,17 @@ geo_fit_xy(
 
     if (surface_vector(sf1, ncoord, ref, residual, error)) goto exit;
     for (i = 0; i < ncoord; ++i) {
-        residual[i] = z[i<<1] - residual[i];
+        residual[i] = z[i] - residual[i];
     }
 
     /* Calculate the higher-order fit */
     if (*has_secondary) {
+        /* The shift geometry may already have allocated it */
+        if (zfit == NULL) {
+            zfit = malloc_with_error(ncoord * sizeof(double), error);
+            if (zfit == NULL) goto exit;
+        }
+
         if (surface_fit(
                     sf2, ncoord, ref, residual, weights,
                     surface_fit_weight_user, &fit_error, error)) goto exit;
@@ -991,7 +1009,7 @@ geo_fit_xy(
 
         if (surface_vector(sf2, ncoord, ref, zfit, error)) goto exit;
         for (i = 0; i < ncoord; ++i) {
-            residual[i] = zfit[i] - residual[i];
+            residual[i] -= zfit[i];
         }
     }
 
@@ -1018,6 +1036,7 @@ geo_fit_xy(
  exit:
 
     surface_free(&savefit);
+    free(z);
     free(zfit);
 
     return status;
@@ -1093,11 +1112,10 @@ geo_fit_reject(
         /* Reject points from the fit */
         for (i = 0; i < ncoord; ++i) {
             if (tweights[i] > 0.0 &&
-                ((abs(residual_x[i]) > cutx) || abs(residual_y[i]) > cuty)) {
+                (fabs(residual_x[i]) > cutx || fabs(residual_y[i]) > cuty)) {
                 tweights[i] = 0.0;
-                ++nreject;
                 assert(nreject < ncoord);
-                fit->rej[nreject] = i;
+                fit->rej[nreject++] = i;
             }
         }
 
@@ -1106,10 +1124,8 @@ geo_fit_reject(
         }
         fit->nreject = nreject;
 
-        /* Compute the number of deleted points */
-        fit->n_zero_weighted = count_zero_weighted(ncoord, weights);
-
-        /* Recompute the X and Y fit */
+        /* Recompute the X and Y fit.  This also updates the number of
+           zero-weighted points from the new weights. */
         switch (fit->fit_geometry) {
         case geomap_fit_rotate:
             if (geo_fit_theta(
@@ -1212,11 +1228,11 @@ geofit(
         break;
     default:
         if (geo_fit_xy(
-                    fit, sx1, sx2, ncoord, 0, input, ref, has_sx2, weights,
+                    fit, sx1, sx2, ncoord, 1, input, ref, has_sx2, weights,
                     residual_x, error)
             ||
             geo_fit_xy(
-                    fit, sy1, sy2, ncoord, 1, input, ref, has_sy2, weights,
+                    fit, sy1, sy2, ncoord, 0, input, ref, has_sy2, weights,
                     residual_y, error)) goto exit;
         break;
     }
@@ -1308,12 +1324,12 @@ geo_get_coeff(
     size_t nxxcoeff, nxycoeff, nyxcoeff, nyycoeff;
     double xxrange  = 1.0;
     double xyrange  = 1.0;
-    double xxmaxmin = 1.0;
-    double xymaxmin = 1.0;
+    double xxmaxmin = 0.0;
+    double xymaxmin = 0.0;
     double yxrange  = 1.0;
     double yyrange  = 1.0;
-    double yxmaxmin = 1.0;
-    double yymaxmin = 1.0;
+    double yxmaxmin = 0.0;
+    double yymaxmin = 0.0;
     double a, b, c, d;
 
     assert(sx);
@@ -1323,34 +1339,43 @@ geo_get_coeff(
     assert(rot);
     assert(sx->coeff);
     assert(sy->coeff);
-    assert(sx->ncoeff >= 3);
-    assert(sy->ncoeff >= 3);
 
-    nxxcoeff = nyxcoeff = sx->nxcoeff;
-    nxycoeff = nyycoeff = sy->nycoeff;
+    nxxcoeff = sx->nxcoeff;
+    nxycoeff = sx->nycoeff;
+    nyxcoeff = sy->nxcoeff;
+    nyycoeff = sy->nycoeff;
 
     /* Get the data range */
     if (sx->type != surface_type_polynomial) {
         xxrange = (sx->bbox.max.x - sx->bbox.min.x) / 2.0;
-        xxmaxmin = -(sx->bbox.max.x - sx->bbox.min.x) / 2.0;
+        xxmaxmin = -(sx->bbox.max.x + sx->bbox.min.x) / 2.0;
         xyrange = (sx->bbox.max.y - sx->bbox.min.y) / 2.0;
-        xymaxmin = (sx->bbox.max.y - sx->bbox.min.y) / 2.0;
+        xymaxmin = -(sx->bbox.max.y + sx->bbox.min.y) / 2.0;
     }
 
     if (sy->type != surface_type_polynomial) {
         yxrange = (sy->bbox.max.x - sy->bbox.min.x) / 2.0;
-        yxmaxmin = (sy->bbox.max.x - sy->bbox.min.x) / 2.0;
+        yxmaxmin = -(sy->bbox.max.x + sy->bbox.min.x) / 2.0;
         yyrange = (sy->bbox.max.y - sy->bbox.min.y) / 2.0;
-        yymaxmin = (sy->bbox.max.y - sy->bbox.min.y) / 2.0;
+        yymaxmin = -(sy->bbox.max.y + sy->bbox.min.y) / 2.0;
     }
 
-    /* Get the shifts */
-    shift->x = sx->coeff[0] + \
-        sx->coeff[1] * xxmaxmin / xxrange + \
-        sx->coeff[2] * xymaxmin / xyrange;
-    shift->y = sy->coeff[0] + \
-        sy->coeff[1] * yxmaxmin / yxrange +
-        sx->coeff[2] * yymaxmin / yyrange;
+    /* Get the shifts.  The xyscale surfaces only have a linear term
+       in one of the axes. */
+    shift->x = sx->coeff[0];
+    if (nxxcoeff > 1) {
+        shift->x += sx->coeff[1] * xxmaxmin / xxrange;
+    }
+    if (nxycoeff > 1) {
+        shift->x += sx->coeff[nxxcoeff] * xymaxmin / xyrange;
+    }
+    shift->y = sy->coeff[0];
+    if (nyxcoeff > 1) {
+        shift->y += sy->coeff[1] * yxmaxmin / yxrange;
+    }
+    if (nyycoeff > 1) {
+        shift->y += sy->coeff[nyxcoeff] * yymaxmin / yyrange;
+    }
 
     /* Get the rotation and scaling parameters */
     if (nxxcoeff > 1) {
@@ -1366,7 +1391,7 @@ geo_get_coeff(
     }
 
     if (nyxcoeff > 1) {
-        c = sx->coeff[1] / yxrange;
+        c = sy->coeff[1] / yxrange;
     } else {
         c = 0.0;
     }
@@ -1416,7 +1441,6 @@ geo_get_results(
         stimage_error_t* const error) {
 
     long   ngood  = 0;
-    size_t i      = 0;
     int    status = 1;
 
     assert(fit);
@@ -1450,25 +1474,19 @@ geo_get_results(
     result->nxcoeff = sx1->ncoeff;
     result->xcoeff = malloc_with_error(result->nxcoeff * sizeof(double), error);
     if (result->xcoeff == NULL) goto exit;
-    for (i = 0; i < result->nxcoeff; ++i) {
-        result->xcoeff[i] = sx1->coeff[i];
-    }
+    memcpy(result->xcoeff, sx1->coeff, result->nxcoeff * sizeof(double));
 
     result->nycoeff = sy1->ncoeff;
     result->ycoeff = malloc_with_error(result->nycoeff * sizeof(double), error);
     if (result->ycoeff == NULL) goto exit;
-    for (i = 0; i < result->nycoeff; ++i) {
-        result->ycoeff[i] = sy1->coeff[i];
-    }
+    memcpy(result->ycoeff, sy1->coeff, result->nycoeff * sizeof(double));
 
     if (has_sx2) {
         result->nx2coeff = sx2->ncoeff;
         result->x2coeff = malloc_with_error(
                 result->nx2coeff * sizeof(double), error);
         if (result->x2coeff == NULL) goto exit;
-        for (i = 0; i < result->nx2coeff; ++i) {
-            result->x2coeff[i] = sx2->coeff[i];
-        }
+        memcpy(result->x2coeff, sx2->coeff, result->nx2coeff * sizeof(double));
 
     } else {
         result->nx2coeff = 0;
@@ -1480,9 +1498,7 @@ geo_get_results(
         result->y2coeff = malloc_with_error(
                 result->ny2coeff * sizeof(double), error);
         if (result->y2coeff == NULL) goto exit;
-        for (i = 0; i < result->ny2coeff; ++i) {
-            result->y2coeff[i] = sy2->coeff[i];
-        }
+        memcpy(result->y2coeff, sy2->coeff, result->ny2coeff * sizeof(double));
     } else {
         result->ny2coeff = 0;
         result->y2coeff = NULL;
@@ -1532,7 +1548,6 @@ geomap(
     double*          xfit           = NULL;
     double*          yfit           = NULL;
     double*          weights        = NULL;
-    double*          tweights       = NULL;
     geomap_output_t* outi           = NULL;
     surface_t        sx1, sy1, sx2, sy2;
     int              has_sx2        = 0;
@@ -1545,16 +1560,23 @@ geomap(
     assert(ref);
     assert(error);
 
+    /* The surfaces are freed on exit, so they must be initialized
+       before any error check */
+    surface_new(&sx1);
+    surface_new(&sy1);
+    surface_new(&sx2);
+    surface_new(&sy2);
+
     if (ninput != nref) {
         stimage_error_set_message(
             error, "Must have the same number of input and reference coordinates.");
         goto exit;
     }
 
-    surface_new(&sx1);
-    surface_new(&sy1);
-    surface_new(&sx2);
-    surface_new(&sy2);
+    if (ninput == 0) {
+        stimage_error_set_message(error, "No coordinates to fit.");
+        goto exit;
+    }
 
     geomap_fit_init(
             &fit, geomap_proj_none, fit_geometry, function,
@@ -1592,6 +1614,14 @@ geomap(
                 ninput, input, ref, &tbbox, input_in_bbox, ref_in_bbox);
     }
 
+    /* Nothing to fit, so bail out before allocating for and computing
+       the fit */
+    if (ninput_in_bbox == 0) {
+        stimage_error_set_message(
+            error, "No coordinates found within the bounding box.");
+        goto exit;
+    }
+
     /* Compute the mean of the reference and input coordinates */
     compute_mean_coord(nref_in_bbox, ref_in_bbox, &fit.oref);
     compute_mean_coord(ninput_in_bbox, input_in_bbox, &fit.oin);
@@ -1635,20 +1665,13 @@ geomap(
 
     /* DIFF: This section is from geo_plistd */
 
-    /* Copy the results to the output buffer */
-    tweights = malloc_with_error(ninput_in_bbox * sizeof(double), error);
-    if (tweights == NULL) goto exit;
-
-    for (i = 0; i < ninput_in_bbox; ++i) {
-        tweights[i] = weights[i];
-    }
-
+    /* Copy the results to the output buffer.  The weights are not
+       needed after the fit, so the rejected points are marked in
+       place rather than in a copy. */
     for (i = 0; i < fit.nreject; ++i) {
         assert(fit.rej);
         assert(fit.rej[i] < ninput_in_bbox);
-        if (weights[fit.rej[i]] > 0.0) {
-            tweights[fit.rej[i]] = 0.0;
-        }
+        weights[fit.rej[i]] = 0.0;
     }
 
     outi = output;
@@ -1657,7 +1680,7 @@ geomap(
         outi->ref.y = ref_in_bbox[i].y;
         outi->input.x = input_in_bbox[i].x;
         outi->input.y = input_in_bbox[i].y;
-        if (tweights[i] > 0.0) {
+        if (weights[i] > 0.0) {
             outi->fit.x = xfit[i];
             outi->fit.y = yfit[i];
             outi->residual.x = input_in_bbox[i].x - xfit[i];
@@ -1684,7 +1707,6 @@ geomap(
     free(weights);
     free(xfit);
     free(yfit);
-    free(tweights);
     surface_free(&sx1);
     surface_free(&sy1);
     surface_free(&sx2);
@@ -57,7 +57,7 @@ match_tolerance(
     size_t         lp          = 0;
     size_t         input_index = 0;
     size_t         ref_index   = 0;
-    double         dx, dy, rmax2, r2;
+    double         dx, dx2, dy, rmax2, r2;
     const coord_t* rmatch;
     const coord_t* lmatch;
 
@@ -99,7 +99,14 @@ match_tolerance(
                 break;
             }
             dx = ref_sorted[rp]->x - input_sorted[lp]->x;
-            r2 = dx*dx + dy*dy;
+            dx2 = dx*dx;
+
+            /* Skip the candidate if it is already too far away in x
+               alone */
+            if (dx2 > rmax2) {
+                continue;
+            }
+            r2 = dx2 + dy*dy;
 
             /* A match has been found */
             if (r2 <= rmax2) {
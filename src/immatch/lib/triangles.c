@@ -388,9 +388,7 @@ reject_triangles_compute_sigma_mode_factor(
         *sigma = sqrt(*sigma);
     }
 
-    /* Sort by the diff of the log-perimeters */
-    sort_doubles(nmatches, diffp);
-
+    /* diffp must already be sorted for the mode computation */
     *mode = compute_mode(nmatches, diffp, 10, 1.0, 0.1 * *sigma, 0.01 * *sigma);
 
     if (nfalse > ntrue) {
@@ -412,6 +410,7 @@ reject_triangles(
         stimage_error_t* error) {
 
     size_t            i            = 0;
+    size_t            j            = 0;
     double            sum          = 0.0;
     double            sumsq        = 0.0;
     int               nplus        = 0;
@@ -458,6 +457,11 @@ reject_triangles(
     ntrue = ABS(nplus - nminus);
     nfalse = ncurrmatches - ntrue;
 
+    /* Sort by the diff of the log-perimeters.  This only needs to be
+       done once: the rejection loop below removes values from diffp
+       in place, which keeps it sorted. */
+    sort_doubles(ncurrmatches, diffp);
+
     if (reject_triangles_compute_sigma_mode_factor(
             ncurrmatches, diffp, sum, sumsq, nfalse, ntrue, &sigma, &mode, &factor)) {
         status = 0;
@@ -493,13 +497,22 @@ reject_triangles(
                         goto exit;
                     }
                 #endif
-                diffp[ncount] = diff;
                 matches[ncount].r = r_tri;
                 matches[ncount].l = l_tri;
                 ++ncount;
             }
         }
 
+        /* Remove the same values from the sorted diffp */
+        j = 0;
+        for (i = 0; i < ncurrmatches; ++i) {
+            diff = diffp[i];
+            if (!(diff < locut || diff > hicut)) {
+                diffp[j++] = diff;
+            }
+        }
+        assert(j == ncount);
+
         /* NOTE: At this point matches[0 --- ncount] contains only
            non-rejected matches.  matches[ncount --- ncurrmatches] is now
            garbage.  Same is true of diffp.  */
@@ -562,11 +575,13 @@ reject_triangles(
 static int
 _match_triangles(
         const size_t nref,
-        const coord_t* const ref,
-        const coord_t* const * const ref_sorted, /*[nref]*/
+        const coord_t* const ref, /*[nref]*/
+        const size_t nref_sorted,
+        const coord_t* const * const ref_sorted, /*[nref_sorted]*/
         const size_t ninput,
         const coord_t* const input, /*[ninput]*/
-        const coord_t* const * const input_sorted,
+        const size_t ninput_sorted,
+        const coord_t* const * const input_sorted, /*[ninput_sorted]*/
         size_t* ncoord_matches,
         const coord_t** refcoord_matches_,
         const coord_t** inputcoord_matches_,
@@ -603,14 +618,14 @@ _match_triangles(
     assert(nmerge);
     assert(error);
 
-    if (nref < 3) {
+    if (nref_sorted < 3) {
         stimage_error_set_message(
             error,
             "Too few reference coordinates to do triangle matching");
         goto exit;
     }
 
-    if (ninput < 3) {
+    if (ninput_sorted < 3) {
         stimage_error_set_message(
             error,
             "Too few input coordinates to do triangle matching");
@@ -618,13 +633,13 @@ _match_triangles(
     }
 
     /* Find all the reference triangles */
-    if (max_num_triangles(nref, nmatch, &nref_triangles, error)) goto exit;
+    if (max_num_triangles(nref_sorted, nmatch, &nref_triangles, error)) goto exit;
 
     ref_triangles = malloc_with_error(
             nref_triangles * sizeof(triangle_t), error);
     if (ref_triangles == NULL) goto exit;
 
-    if (find_triangles(nref, ref_sorted, &nref_triangles, ref_triangles,
+    if (find_triangles(nref_sorted, ref_sorted, &nref_triangles, ref_triangles,
                        nmatch, tolerance, maxratio, error)) goto exit;
 
     if (nref_triangles == 0) {
@@ -635,13 +650,13 @@ _match_triangles(
     }
 
     /* Find all the input triangles */
-    if (max_num_triangles(ninput, nmatch, &ninput_triangles, error)) goto exit;
+    if (max_num_triangles(ninput_sorted, nmatch, &ninput_triangles, error)) goto exit;
 
     input_triangles = malloc_with_error(
             ninput_triangles * sizeof(triangle_t), error);
     if (input_triangles == NULL) goto exit;
 
-    if (find_triangles(ninput, input_sorted, &ninput_triangles,
+    if (find_triangles(ninput_sorted, input_sorted, &ninput_triangles,
                        input_triangles, nmatch, tolerance, maxratio,
                        error)) goto exit;
 
@@ -764,8 +779,8 @@ match_triangles(
     if (inputcoord_matches == NULL) goto exit;
 
     if (_match_triangles(
-        nref_unique, ref, ref_sorted,
-        ninput_unique, input, input_sorted,
+        nref, ref, nref_unique, ref_sorted,
+        ninput, input, ninput_unique, input_sorted,
         &ncoord_matches, refcoord_matches, inputcoord_matches,
         nmatch, tolerance, maxratio, nreject,
         &nkeep, &nmerge,
@@ -783,8 +798,8 @@ match_triangles(
     if (ncoord_matches < nmatch && ncoord_matches > 2) {
         ncheck = ncoord_matches;
         if (_match_triangles(
-                ncoord_matches, ref, refcoord_matches,
-                ncoord_matches, input, inputcoord_matches,
+                nref, ref, ncoord_matches, refcoord_matches,
+                ninput, input, ncoord_matches, inputcoord_matches,
                 &ncoord_matches, refcoord_matches, inputcoord_matches,
                 nmatch, tolerance, maxratio, nreject,
                 &nkeep, &nmerge, error)) goto exit;
@@ -52,7 +52,10 @@ vote_triangle_matches(
         const coord_t** const inputcoord_matches,
         stimage_error_t* const error) {
 
-    typedef size_t vote_t;
+    /* A pair can get at most one vote per matched triangle, so an
+       unsigned int is plenty, and it halves the size of the dense
+       vote table compared to size_t */
+    typedef unsigned int vote_t;
 
     vote_t*           votes        = NULL;
     vote_t            maxvote      = 0;
@@ -78,20 +81,14 @@ vote_triangle_matches(
     assert(inputcoord_matches);
     assert(error);
 
-    /* Since the vote tallies are rather sparse, this uses a nested
-       map from reference coordinates to a map from input coordinates
-       to vote counts. */
+    /* The vote tallies are kept in a dense nleft x nright array
+       indexed directly by coordinate index, so no lookup is needed
+       per vote. */
 
     #define VOTE(li, ri) votes[(ri) * nleft + (li)]
 
-    votes = malloc(nleft * nright * sizeof(size_t));
-    if (votes == NULL) {
-        goto exit;
-    }
-
-    for (i = 0; i < nleft * nright; ++i) {
-        votes[i] = 0;
-    }
+    votes = calloc_with_error(nleft * nright, sizeof(vote_t), error);
+    if (votes == NULL) goto exit;
 
     /* Accumulate the votes */
     for (i = 0; i < ntriangle_matches; ++i) {
@@ -153,9 +150,9 @@ vote_triangle_matches(
 
         /* Remove all future matches involving the input coord, so it
            won't be matched twice. */
+        li = l_coord - left;
         for (ri2 = ri; ri2 < nright; ++ri2) {
-            li = l_coord - left;
-            VOTE(li, ri) = 0;
+            VOTE(li, ri2) = 0;
         }
 
         #ifndef NDEBUG
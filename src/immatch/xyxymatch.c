@@ -119,6 +119,7 @@ xyxymatch(
     static const coord_t      DEFAULT_ROTATION   = {0.0, 0.0};
     static const coord_t      DEFAULT_REF_ORIGIN = {0.0, 0.0};
     coord_t*                  input_trans        = NULL;
+    const coord_t*            input_xform        = input;
     const coord_t**           input_trans_sorted = NULL;
     size_t                    ninput_unique      = ninput;
     const coord_t**           ref_sorted         = NULL;
@@ -184,14 +185,20 @@ xyxymatch(
     /****************************************
      PREPARE INPUT COORDINATES
     */
-    input_trans = malloc_with_error(ninput * sizeof(coord_t), error);
-    if (input_trans == NULL) goto exit;
+    /* If the initial transform is a no-op, the input coordinates can
+       be used directly, saving an alloc and copy */
+    if (!lintransform_is_identity(&lintransform)) {
+        input_trans = malloc_with_error(ninput * sizeof(coord_t), error);
+        if (input_trans == NULL) goto exit;
+
+        apply_lintransform(&lintransform, ninput, input, input_trans);
+        input_xform = input_trans;
+    }
 
     input_trans_sorted = malloc_with_error(ninput * sizeof(coord_t*), error);
     if (input_trans_sorted == NULL) goto exit;
 
-    apply_lintransform(&lintransform, ninput, input, input_trans);
-    xysort(ninput, input_trans, input_trans_sorted);
+    xysort(ninput, input_xform, input_trans_sorted);
     ninput_unique = xycoincide(ninput, input_trans_sorted, input_trans_sorted, separation);
 
     /****************************************
@@ -207,7 +214,7 @@ xyxymatch(
     case xyxymatch_algo_tolerance:
         if (match_tolerance(
                 nref_unique, ref, ref_sorted,
-                ninput_unique, input_trans, input_trans_sorted,
+                ninput_unique, input_xform, input_trans_sorted,
                 tolerance,
                 xyxymatch_callback, &state,
                 error)) goto exit;
@@ -216,7 +223,7 @@ xyxymatch(
     case xyxymatch_algo_triangles:
         if (match_triangles(
                 nref, nref_unique, ref, ref_sorted,
-                ninput, ninput_unique, input_trans, input_trans_sorted,
+                ninput, ninput_unique, input_xform, input_trans_sorted,
                 nmatch, tolerance, maxratio, nreject,
                 &xyxymatch_callback, &state,
                 error)) goto exit;
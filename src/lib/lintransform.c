@@ -48,6 +48,8 @@ compute_lintransform(
     const coord_t out,
     lintransform_t* coeffs) {
 
+    double xrot, yrot;
+
     assert(coeffs);
 
     assert(coord_is_finite(&in));
@@ -55,12 +57,15 @@ compute_lintransform(
     assert(coord_is_finite(&rot));
     assert(coord_is_finite(&out));
 
-    coeffs->a = mag.x * cos(DEGTORAD(rot.x));
-    coeffs->b = -mag.y * sin(DEGTORAD(rot.y));
+    xrot = DEGTORAD(rot.x);
+    yrot = DEGTORAD(rot.y);
+
+    coeffs->a = mag.x * cos(xrot);
+    coeffs->b = -mag.y * sin(yrot);
     coeffs->c = out.x - coeffs->a * in.x - coeffs->b * in.y;
 
-    coeffs->d = mag.x * sin(DEGTORAD(rot.x));
-    coeffs->e = mag.y * cos(DEGTORAD(rot.y));
+    coeffs->d = mag.x * sin(xrot);
+    coeffs->e = mag.y * cos(yrot);
     coeffs->f = out.y - coeffs->d * in.x - coeffs->e * in.y;
 }
 
@@ -73,18 +78,29 @@ apply_lintransform(
 
     size_t i;
     double x, y;
+    double a, b, c, d, e, f;
 
     assert(coeffs);
     assert(input);
     assert(output);
 
+    /* Load the coefficients once.  Since output is also made of
+       doubles, the compiler would otherwise have to reload them after
+       every store. */
+    a = coeffs->a;
+    b = coeffs->b;
+    c = coeffs->c;
+    d = coeffs->d;
+    e = coeffs->e;
+    f = coeffs->f;
+
     for (i = 0; i < ncoords; ++i) {
         assert(coord_is_finite(input + i));
 
         x = input[i].x;
         y = input[i].y;
 
-        output[i].x = coeffs->a * x + coeffs->b * y + coeffs->c;
-        output[i].y = coeffs->d * x + coeffs->e * y + coeffs->f;
+        output[i].x = a * x + b * y + c;
+        output[i].y = d * x + e * y + f;
     }
 }
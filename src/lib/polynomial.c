@@ -101,7 +101,7 @@ eval_1dpoly(
 
     free(tmp);
 
-    return 0;
+    return status;
 }
 
 int
@@ -121,8 +121,8 @@ eval_1dchebyshev(
     const double* x      = (double *)ref + axis;
     double        c1     = 0.0;
     double        c2     = 0.0;
+    double        pn     = 0.0;
     double*       sx     = NULL;
-    double*       pn     = NULL;
     double*       pnm1   = NULL;
     double*       pnm2   = NULL;
     int           status = 1;
@@ -150,17 +150,11 @@ eval_1dchebyshev(
         return 0;
     }
 
-    sx = malloc_with_error(ncoord * sizeof(double), error);
+    /* The three scratch vectors share a single allocation */
+    sx = malloc_with_error(3 * ncoord * sizeof(double), error);
     if (sx == NULL) goto exit;
-
-    pn = malloc_with_error(ncoord * sizeof(double), error);
-    if (pn == NULL) goto exit;
-
-    pnm1 = malloc_with_error(ncoord * sizeof(double), error);
-    if (pnm1 == NULL) goto exit;
-
-    pnm2 = malloc_with_error(ncoord * sizeof(double), error);
-    if (pnm2 == NULL) goto exit;
+    pnm1 = sx + ncoord;
+    pnm2 = pnm1 + ncoord;
 
     for (i = 0; i < ncoord; ++i) {
         pnm2[i] = 1.0;
@@ -168,21 +162,14 @@ eval_1dchebyshev(
         sx[i] *= 2;
     }
 
+    /* Compute each term, add it in and advance the recurrence in a
+       single pass over the coordinates */
     for (j = 2; j < order; ++j) {
         for (i = 0; i < ncoord; ++i) {
-            pn[i] = (sx[i] * pnm1[i]) - pnm2[i];
-        }
-
-        if (j < order - 1) {
-            for (i = 0; i < ncoord; ++i) {
-                pnm2[i] = pnm1[i];
-                pnm1[i] = pn[i];
-            }
-        }
-
-        for (i = 0; i < ncoord; ++i) {
-            pn[i] *= coeff[j];
-            zfit[i] += pn[i];
+            pn = (sx[i] * pnm1[i]) - pnm2[i];
+            zfit[i] += pn * coeff[j];
+            pnm2[i] = pnm1[i];
+            pnm1[i] = pn;
         }
     }
 
@@ -191,11 +178,8 @@ eval_1dchebyshev(
  exit:
 
     free(sx);
-    free(pn);
-    free(pnm1);
-    free(pnm2);
 
-    return 0;
+    return status;
 }
 
 int
@@ -216,8 +200,8 @@ eval_1dlegendre(
     double        ri     = 0.0;
     double        ri1    = 0.0;
     double        ri2    = 0.0;
+    double        pn     = 0.0;
     double*       sx     = NULL;
-    double*       pn     = NULL;
     double*       pnm1   = NULL;
     double*       pnm2   = NULL;
     int           status = 1;
@@ -245,17 +229,11 @@ eval_1dlegendre(
         return 0;
     }
 
-    sx = malloc_with_error(ncoord * sizeof(double), error);
+    /* The three scratch vectors share a single allocation */
+    sx = malloc_with_error(3 * ncoord * sizeof(double), error);
     if (sx == NULL) goto exit;
-
-    pn = malloc_with_error(ncoord * sizeof(double), error);
-    if (pn == NULL) goto exit;
-
-    pnm1 = malloc_with_error(ncoord * sizeof(double), error);
-    if (pnm1 == NULL) goto exit;
-
-    pnm2 = malloc_with_error(ncoord * sizeof(double), error);
-    if (pnm2 == NULL) goto exit;
+    pnm1 = sx + ncoord;
+    pnm2 = pnm1 + ncoord;
 
     for (i = 0; i < ncoord; ++i) {
         pnm2[i] = 1.0;
@@ -267,21 +245,14 @@ eval_1dlegendre(
         ri1 = (2.0 * ri - 3.0) / (ri - 1.0);
         ri2 = -(ri - 2.0) / (ri - 1.0);
 
+        /* Compute each term, add it in and advance the recurrence in
+           a single pass over the coordinates */
         for (i = 0; i < ncoord; ++i) {
-            pn[i] = sx[i] * pnm1[i];
-            pn[i] = pn[i] * ri1 + pnm2[i] * ri2;
-        }
-
-        if (j < order - 1) {
-            for (i = 0; i < ncoord; ++i) {
-                pnm2[i] = pnm1[i];
-                pnm1[i] = pn[i];
-            }
-        }
-
-        for (i = 0; i < ncoord; ++i) {
-            pn[i] *= coeff[j];
-            zfit[i] += pn[i];
+            pn = sx[i] * pnm1[i];
+            pn = pn * ri1 + pnm2[i] * ri2;
+            zfit[i] += pn * coeff[j];
+            pnm2[i] = pnm1[i];
+            pnm1[i] = pn;
         }
     }
 
@@ -290,9 +261,6 @@ eval_1dlegendre(
  exit:
 
     free(sx);
-    free(pn);
-    free(pnm1);
-    free(pnm2);
 
     return status;
 }
@@ -486,37 +454,43 @@ eval_poly_generic(
         return 0;
     }
 
-    /* Fit first order in x and y */
-    if (xorder == 2 && yorder == 1) {
-        for (i = 0; i < ncoord; ++i) {
-            zfit[i] += ref[i].x * coeff[1];
+    /* Fit first order in x and y.  These shortcuts use the raw
+       coordinates, so they only apply to the plain polynomial
+       basis. */
+    if (basis_function == &basis_poly) {
+        if (xorder == 2 && yorder == 1) {
+            for (i = 0; i < ncoord; ++i) {
+                zfit[i] = coeff[0] + ref[i].x * coeff[1];
+            }
+
+            return 0;
         }
 
-        return 0;
-    }
+        if (yorder == 2 && xorder == 1) {
+            for (i = 0; i < ncoord; ++i) {
+                zfit[i] = coeff[0] + ref[i].y * coeff[1];
+            }
 
-    if (yorder == 2 && xorder == 1) {
-        for (i = 0; i < ncoord; ++i) {
-            zfit[i] += ref[i].y * coeff[1];
+            return 0;
         }
 
-        return 0;
-    }
+        if (yorder == 2 && xorder == 2 && xterms == xterms_none) {
+            for (i = 0; i < ncoord; ++i) {
+                zfit[i] = coeff[0] + ref[i].x * coeff[1] +
+                    ref[i].y * coeff[2];
+            }
 
-    if (yorder == 2 && xorder == 2 && xterms == xterms_none) {
-        for (i = 0; i < ncoord; ++i) {
-            zfit[i] += ref[i].x * coeff[1] + ref[i].y * coeff[2];
+            return 0;
         }
-
-        return 0;
     }
 
-    xb = malloc_with_error(xorder * ncoord * sizeof(double), error);
+    /* The x and y basis functions and the accumulator share a single
+       allocation */
+    xb = malloc_with_error(
+            (xorder + yorder + 1) * ncoord * sizeof(double), error);
     if (xb == NULL) goto exit;
-    yb = malloc_with_error(yorder * ncoord * sizeof(double), error);
-    if (yb == NULL) goto exit;
-    accum = malloc_with_error(ncoord * sizeof(double), error);
-    if (accum == NULL) goto exit;
+    yb = xb + xorder * ncoord;
+    accum = yb + yorder * ncoord;
 
     /* Calculate basis functions */
     if (basis_function(ncoord, 0, ref, xorder, k1x, k2x, xb, error)) goto exit;
@@ -539,20 +513,21 @@ eval_poly_generic(
                 for (i = 0; i < ncoord; ++i) {
                     accum[i] += xbp[i] * coeff[cp+k];
                 }
+                xbp += ncoord;
             }
-            xbp += ncoord;
-        }
 
-        for (i = 0; i < ncoord; ++i) {
-            zfit[i] += accum[i] * ybp[i];
-        }
+            for (i = 0; i < ncoord; ++i) {
+                zfit[i] += accum[i] * ybp[i];
+            }
 
-        cp += xincr;
-        ybp += ncoord;
+            cp += xincr;
+            ybp += ncoord;
 
-        if (xterms == xterms_half) {
-            if ((j + xorder + 1) > maxorder) {
-                xincr -= 1;
+            /* j is 0-based, so this is row j + 1 */
+            if (xterms == xterms_half) {
+                if ((j + xorder + 2) > maxorder) {
+                    xincr -= 1;
+                }
             }
         }
     } else { /* xterms == surface_xterms_none */
@@ -579,8 +554,6 @@ eval_poly_generic(
 
  exit:
     free(xb);
-    free(yb);
-    free(accum);
 
     return status;
 }
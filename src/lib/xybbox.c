@@ -77,6 +77,7 @@ limit_to_bbox(
 
     size_t i = 0;
     size_t nout = 0;
+    bbox_t limits;
 
     assert(input);
     assert(ref);
@@ -85,17 +86,17 @@ limit_to_bbox(
     assert(ref_in_bbox);
     assert(bbox_is_valid(bbox));
 
+    /* Open up any unset sides of the bbox once, rather than checking
+       for them on every coordinate.  The limits are infinite so that
+       infinite coordinates still pass an unset side. */
+    limits.min.x = isfinite64(bbox->min.x) ? bbox->min.x : -HUGE_VAL;
+    limits.min.y = isfinite64(bbox->min.y) ? bbox->min.y : -HUGE_VAL;
+    limits.max.x = isfinite64(bbox->max.x) ? bbox->max.x : HUGE_VAL;
+    limits.max.y = isfinite64(bbox->max.y) ? bbox->max.y : HUGE_VAL;
+
     for (i = 0; i < ncoord; ++i) {
-        if (isfinite64(bbox->min.x) && ref[i].x < bbox->min.x) {
-            continue;
-        }
-        if (isfinite64(bbox->max.x) && ref[i].x > bbox->max.x) {
-            continue;
-        }
-        if (isfinite64(bbox->min.y) && ref[i].y < bbox->min.y) {
-            continue;
-        }
-        if (isfinite64(bbox->max.y) && ref[i].y > bbox->max.y) {
+        if (ref[i].x < limits.min.x || ref[i].x > limits.max.x ||
+            ref[i].y < limits.min.y || ref[i].y > limits.max.y) {
             continue;
         }
 
@@ -105,7 +106,7 @@ limit_to_bbox(
         ref_in_bbox[nout].y   = ref[i].y;
         ++nout;
 
-        assert(nout < ncoord);
+        assert(nout <= ncoord);
     }
 
     return nout;
@@ -68,7 +68,9 @@ xysort_compare(const void* ap, const void* bp) {
         } else if (a->x > b->x) {
             return 1;
         } else {
-            return 0;
+            /* Break ties on the original position, which makes the
+               sort stable even though qsort itself is not */
+            return (a > b) - (a < b);
         }
     }
 }
@@ -89,5 +91,5 @@ xysort(
         coords_ptr[i] = (coord_t*)coords + i;
     }
 
-    qsort(coords_ptr, ncoords, sizeof(coord_t**), &xysort_compare);
+    qsort(coords_ptr, ncoords, sizeof(coord_t*), &xysort_compare);
 }
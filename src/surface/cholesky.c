@@ -84,21 +84,22 @@ cholesky_factorization(
 
         assert(MATFAC(0, n) != 0.0);
         MATFAC(0, n) = 1.0 / MATFAC(0, n);
-        imax = MIN(nbands - 1, nrows - n);
-        if (imax < 0) {
+        /* n is 0-based, so the rows below the diagonal start at
+           n + 1 */
+        imax = (int)MIN(nbands - 1, nrows - n - 1);
+        if (imax < 1) {
             continue;
         }
 
         jmax = imax;
         for (i = 0; i < (size_t)imax; ++i) {
-            assert(n < nbands && i+1 < nrows);
+            assert(n < nrows && i+1 < nbands);
             ratio = MATFAC(i+1, n) * MATFAC(0, n);
             for (j = 0; j < (size_t)jmax; ++j) {
-                assert(n+i < nbands && j < nrows && j+i < nrows);
-                MATFAC(j, n+i) = MATFAC(j, n+i) - MATFAC(j+i, n) * ratio;
+                assert(n+i+1 < nrows && j+i+1 < nbands);
+                MATFAC(j, n+i+1) = MATFAC(j, n+i+1) - MATFAC(j+i+1, n) * ratio;
             }
             --jmax;
-            assert(n < nbands && i+1 < nrows);
             MATFAC(i+1, n) = ratio;
         }
     }
@@ -144,22 +145,18 @@ cholesky_solve(
     /* Forward substitution */
     nbands_m1 = nbands - 1;
     for (n = 0; n < (int)nrows; ++n) {
-        jmax = MIN(nbands_m1, nrows - n);
-        if (jmax >= 1) {
-            for (j = 0; j < jmax; ++j) {
-                coeff[j+n] -= MATFAC(j+1, n) * coeff[n];
-            }
+        jmax = MIN(nbands_m1, nrows - n - 1);
+        for (j = 0; j < jmax; ++j) {
+            coeff[n+j+1] -= MATFAC(j+1, n) * coeff[n];
         }
     }
 
     /* Back substitution */
     for (n = (int)nrows - 1; n >= 0; --n) {
         coeff[n] *= MATFAC(0, n);
-        jmax = MIN(nbands_m1, nrows - n);
-        if (jmax >= 1) {
-            for (j = 0; j < jmax; ++j) {
-                coeff[n] -= MATFAC(j+1, n) * coeff[j+n];
-            }
+        jmax = MIN(nbands_m1, nrows - n - 1);
+        for (j = 0; j < jmax; ++j) {
+            coeff[n] -= MATFAC(j+1, n) * coeff[n+j+1];
         }
     }
 
@@ -64,10 +64,11 @@ surface_fit_add_points(
         stimage_error_t* const error) {
 
     size_t i, j, k, l, ii, jj, ll;
-    double* byw = NULL;
-    double* bw = NULL;
-    double* xbasis = NULL;
-    double* ybasis = NULL;
+    double* work = NULL;
+    double* byw;
+    double* bw;
+    double* xbasis;
+    double* ybasis;
     double* vzp;
     double* mzp;
     double* bxp;
@@ -76,6 +77,7 @@ surface_fit_add_points(
     double* mindex;
     double* bbyp;
     double* bbxp;
+    double sum;
     int xorder;
     int xxorder;
     int maxorder;
@@ -122,10 +124,16 @@ surface_fit_add_points(
         break;
     }
 
-    xbasis = malloc_with_error(ncoord * s->xorder * sizeof(double), error);
-    if (xbasis == NULL) goto exit;
-    ybasis = malloc_with_error(ncoord * s->yorder * sizeof(double), error);
-    if (ybasis == NULL) goto exit;
+    /* All of the temporary arrays are carved out of a single
+       allocation: the x and y basis functions, followed by the two
+       weighted accumulators */
+    work = malloc_with_error(
+            ncoord * (s->xorder + s->yorder + 2) * sizeof(double), error);
+    if (work == NULL) goto exit;
+    xbasis = work;
+    ybasis = xbasis + ncoord * s->xorder;
+    byw = ybasis + ncoord * s->yorder;
+    bw = byw + ncoord;
 
     /* Calculate the non-zero basis functions */
     switch (s->type) {
@@ -158,12 +166,6 @@ surface_fit_add_points(
         goto exit;
     }
 
-    /* Allocate temporary space for matrix accumulation */
-    byw = malloc_with_error(ncoord * sizeof(double), error);
-    if (byw == NULL) goto exit;
-    bw = malloc_with_error(ncoord * sizeof(double), error);
-    if (bw == NULL) goto exit;
-
     vzp = s->vector - 1;
     mzp = s->matrix;
     bxp = xbasis;
@@ -179,7 +181,7 @@ surface_fit_add_points(
 
         bxp = xbasis;
 
-        for (k = 1; k <= s->xorder; ++k) {
+        for (k = 1; k <= xorder; ++k) {
             for (i = 0; i < ncoord; ++i) {
                 bw[i] = byw[i] * bxp[i];
             }
@@ -198,9 +200,13 @@ surface_fit_add_points(
                 assert(mindex - s->matrix < s->ncoeff * s->ncoeff);
                 assert((bbxp - xbasis) + ncoord - 1 < ncoord * s->xorder);
                 assert((bbyp - ybasis) + ncoord - 1 < ncoord * s->yorder);
+                /* Accumulate in a local so the compiler doesn't have to
+                   reload and store through mindex on every point */
+                sum = 0.0;
                 for (i = 0; i < ncoord; ++i) {
-                    *mindex += bw[i] * bbxp[i] * bbyp[i];
+                    sum += bw[i] * bbxp[i] * bbyp[i];
                 }
+                *mindex += sum;
                 if (jj % xxorder == 0) {
                     jj = 1;
                     ++ll;
@@ -248,14 +254,9 @@ surface_fit_add_points(
 
     status = 0;
 
-    surface_print(s);
-
  exit:
 
-    free(byw);
-    free(bw);
-    free(xbasis);
-    free(ybasis);
+    free(work);
 
     return status;
 }
@@ -302,8 +303,6 @@ surface_fit_solve(
         return 1;
     }
 
-    surface_print(s);
-
     return 0;
 }
 
@@ -88,9 +88,9 @@ surface_init(
             goto fail;
         }
         s->xrange = 2.0 / (bbox->max.x - bbox->min.x);
-        s->xmaxmin = -(bbox->max.x - bbox->min.x) / 2.0;
+        s->xmaxmin = -(bbox->max.x + bbox->min.x) / 2.0;
         s->yrange = 2.0 / (bbox->max.y - bbox->min.y);
-        s->ymaxmin = -(bbox->max.y - bbox->min.y) / 2.0;
+        s->ymaxmin = -(bbox->max.y + bbox->min.y) / 2.0;
         break;
 
     case surface_type_polynomial:
@@ -182,15 +182,11 @@ surface_copy_vector(
         double** const d,
         stimage_error_t* const error) {
 
-    size_t i;
-
     if (s != NULL) {
         free(*d);
         *d = malloc_with_error(size * sizeof(double), error);
         if (*d == NULL) return 1;
-        for (i = 0; i < size; ++i) {
-            (*d)[i] = s[i];
-        }
+        memcpy(*d, s, size * sizeof(double));
     }
 
     return 0;
@@ -247,8 +243,6 @@ surface_zero(
         surface_t* const s,
         stimage_error_t* const error) {
 
-    size_t i;
-
     assert(s);
     assert(s->vector);
     assert(s->matrix);
@@ -259,21 +253,11 @@ surface_zero(
     case surface_type_chebyshev:
         /* s->npoints = 0; */
 
-        for (i = 0; i < s->ncoeff; ++i) {
-            s->vector[i] = 0.0;
-        }
-
-        for (i = 0; i < s->ncoeff; ++i) {
-            s->coeff[i] = 0.0;
-        }
-
-        for (i = 0; i < s->ncoeff * s->ncoeff; ++i) {
-            s->matrix[i] = 0.0;
-        }
-
-        for (i = 0; i < s->ncoeff * s->ncoeff; ++i) {
-            s->cholesky_fact[i] = 0.0;
-        }
+        /* All-bits-zero is 0.0 in IEEE 754 */
+        memset(s->vector, 0, s->ncoeff * sizeof(double));
+        memset(s->coeff, 0, s->ncoeff * sizeof(double));
+        memset(s->matrix, 0, s->ncoeff * s->ncoeff * sizeof(double));
+        memset(s->cholesky_fact, 0, s->ncoeff * s->ncoeff * sizeof(double));
 
         break;
     default:
@@ -69,15 +69,15 @@ geomap_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
 static PyObject *
 geomap_array_init() {
-    PyObject *o = NULL;
+    PyArrayObject *o = NULL;
     npy_intp dims = 1;
     
-    o = PyArray_SimpleNew(1, &dims, NPY_DOUBLE);
+    o = (PyArrayObject*)PyArray_SimpleNew(1, &dims, NPY_DOUBLE);
     if (o != NULL) {
         *((double*)PyArray_GETPTR1(o, 0)) = 0.0;
     }
 
-    return o;
+    return (PyObject*)o;
 }
 
 static int
@@ -203,6 +203,25 @@ static PyTypeObject geomap_class = {
     geomap_new,                /* tp_new */
 };
 
+int
+geomap_results_init_type(void) {
+    return PyType_Ready(&geomap_class);
+}
+
+static PyArray_Descr* geomap_output_dtype = NULL;
+
+static const char* const geomap_output_fields[] = {
+    "input_x", "f8",
+    "input_y", "f8",
+    "ref_x", "f8",
+    "ref_y", "f8",
+    "fit_x", "f8",
+    "fit_y", "f8",
+    "resid_x", "f8",
+    "resid_y", "f8",
+    NULL
+};
+
 PyObject*
 py_geomap(PyObject* self, PyObject* args, PyObject* kwds) {
     PyObject* input_obj        = NULL;
@@ -221,9 +240,9 @@ py_geomap(PyObject* self, PyObject* args, PyObject* kwds) {
     double    reject           = 0.0;
 
     size_t         ninput       = 0;
-    PyObject*      input_array  = NULL;
+    PyArrayObject* input_array  = NULL;
     size_t         nref         = 0;
-    PyObject*      ref_array    = NULL;
+    PyArrayObject* ref_array    = NULL;
     bbox_t         bbox;
     geomap_fit_e   fit_geometry = geomap_fit_general;
     surface_type_e surface_type = surface_type_polynomial;
@@ -233,10 +252,8 @@ py_geomap(PyObject* self, PyObject* args, PyObject* kwds) {
     geomap_result_t  fit;
     PyObject*        tmp          = NULL;
     npy_intp         dims         = 0;
-    size_t           i            = 0;
     size_t           noutput      = 0;
     geomap_output_t* output       = NULL;
-    PyObject*        dtype_list   = NULL;
     PyArray_Descr*   dtype        = NULL;
     PyObject*        result       = NULL;
     PyObject*        output_array = NULL;
@@ -261,7 +278,7 @@ py_geomap(PyObject* self, PyObject* args, PyObject* kwds) {
         return NULL;
     }
 
-    input_array = (PyObject*)PyArray_ContiguousFromAny(
+    input_array = (PyArrayObject*)PyArray_ContiguousFromAny(
             input_obj, NPY_DOUBLE, 2, 2);
     if (input_array == NULL) {
         goto exit;
@@ -271,7 +288,7 @@ py_geomap(PyObject* self, PyObject* args, PyObject* kwds) {
         goto exit;
     }
 
-    ref_array = (PyObject*)PyArray_ContiguousFromAny(
+    ref_array = (PyArrayObject*)PyArray_ContiguousFromAny(
             ref_obj, NPY_DOUBLE, 2, 2);
     if (ref_array == NULL) {
         goto exit;
@@ -311,44 +328,46 @@ py_geomap(PyObject* self, PyObject* args, PyObject* kwds) {
         goto exit;
     }
 
-    dtype_list = Py_BuildValue(
-            "[(ss)(ss)(ss)(ss)(ss)(ss)(ss)(ss)]",
-            "input_x", "f8",
-            "input_y", "f8",
-            "ref_x", "f8",
-            "ref_y", "f8",
-            "fit_x", "f8",
-            "fit_y", "f8",
-            "resid_x", "f8",
-            "resid_y", "f8");
-    if (dtype_list == NULL) {
+    dtype = get_cached_dtype(&geomap_output_dtype, geomap_output_fields);
+    if (dtype == NULL) {
         goto exit;
     }
-    if (!PyArray_DescrConverter(dtype_list, &dtype)) {
-        goto exit;
-    }
-    Py_DECREF(dtype_list);
     dims = (npy_intp)noutput;
     output_array = PyArray_NewFromDescr(
-            &PyArray_Type, dtype, 1, &dims, NULL, output,
-            NPY_OWNDATA, NULL);
+            &PyArray_Type, dtype, 1, &dims, NULL, output, 0, NULL);
     if (output_array == NULL) {
         goto exit;
     }
+    if (set_array_base_to_malloced((PyArrayObject*)output_array, output)) {
+        output = NULL;
+        goto exit;
+    }
+    /* The array owns output now */
+    output = NULL;
 
     fit_obj = geomap_new(&geomap_class, NULL, NULL);
-    
+    if (fit_obj == NULL) {
+        goto exit;
+    }
+
     #define ADD_ATTR(func, member, name) \
         if ((func)((member), &tmp)) goto exit;      \
-        PyObject_SetAttrString(fit_obj, (name), tmp);       \
+        if (PyObject_SetAttrString(fit_obj, (name), tmp)) { \
+            Py_DECREF(tmp); \
+            goto exit; \
+        } \
         Py_DECREF(tmp);
 
     #define ADD_ARRAY(size, member, name) \
         dims = (size); \
         tmp = PyArray_SimpleNew(1, &dims, NPY_DOUBLE); \
         if (tmp == NULL) goto exit; \
-        for (i = 0; i < (size); ++i) ((double*)PyArray_DATA(tmp))[i] = (member)[i]; \
-        PyObject_SetAttrString(fit_obj, (name), tmp); \
+        if ((size)) memcpy(PyArray_DATA((PyArrayObject*)tmp), (member), \
+                           (size) * sizeof(double)); \
+        if (PyObject_SetAttrString(fit_obj, (name), tmp)) { \
+            Py_DECREF(tmp); \
+            goto exit; \
+        } \
         Py_DECREF(tmp);
 
     ADD_ATTR(from_geomap_fit_e, fit.fit_geometry, "fit_geometry");
@@ -368,59 +387,13 @@ py_geomap(PyObject* self, PyObject* args, PyObject* kwds) {
 
  exit:
 
-    Py_DECREF(input_array);
-    Py_DECREF(ref_array);
+    Py_XDECREF(input_array);
+    Py_XDECREF(ref_array);
     geomap_result_free(&fit);
-    if (result == NULL) {
-        Py_XDECREF(output_array);
-        free(output);
-        Py_XDECREF(fit_obj);
-    }
+    /* Py_BuildValue holds its own references to these */
+    Py_XDECREF(output_array);
+    Py_XDECREF(fit_obj);
+    free(output);
 
     return result;
 }
-
-#if PY_MAJOR_VERSION >= 3
-
-static PyModuleDef geomap_module = {
-    PyModuleDef_HEAD_INIT,
-    "geomap_results",
-    "Python object to hold the results of geomap",
-    -1,
-    NULL, NULL, NULL, NULL, NULL
-};
-
-PyMODINIT_FUNC
-PyInit_geomap_results(void) 
-{
-    PyObject* m;
-
-    geomap_class.tp_new = PyType_GenericNew;
-    if (PyType_Ready(&geomap_class) < 0)
-        return NULL;
-
-    m = PyModule_Create(&geomap_module);
-    if (m == NULL)
-        return NULL;
-
-    Py_INCREF(&geomap_class);
-    PyModule_AddObject(m, "GeomapResults", (PyObject *)&geomap_class);
-    return m;
-}
-
-#else
-PyMODINIT_FUNC
-initgeomap_results(void) 
-{
-    PyObject* m;
-
-    geomap_class.tp_new = PyType_GenericNew;
-    if (PyType_Ready(&geomap_class) < 0)
-        return;
-
-    m = Py_InitModule("GeomapResults", geomap_methods);
-
-    Py_INCREF(&geomap_class);
-    PyModule_AddObject(m, "GeomapResults", (PyObject *)&geomap_class);
-}
-#endif
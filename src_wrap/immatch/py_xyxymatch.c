@@ -41,6 +41,8 @@ DAMAGE.
 
 #include "immatch/xyxymatch.h"
 
+static PyArray_Descr* xyxymatch_dtype = NULL;
+
 PyObject*
 py_xyxymatch(PyObject* self, PyObject* args, PyObject* kwds) {
     PyObject* input_obj      = NULL;
@@ -56,8 +58,8 @@ py_xyxymatch(PyObject* self, PyObject* args, PyObject* kwds) {
     double    maxratio       = 10.0;
     size_t    nreject        = 10;
 
-    PyObject*        input_array = NULL;
-    PyObject*        ref_array   = NULL;
+    PyArrayObject*   input_array = NULL;
+    PyArrayObject*   ref_array   = NULL;
     coord_t          origin      = {0.0, 0.0};
     coord_t          mag         = {1.0, 1.0};
     coord_t          rotation    = {0.0, 0.0};
@@ -67,11 +69,21 @@ py_xyxymatch(PyObject* self, PyObject* args, PyObject* kwds) {
     PyObject*           result     = NULL;
     size_t              noutput    = 0;
     xyxymatch_output_t* output     = NULL;
-    PyObject*           dtype_list = NULL;
     PyArray_Descr*      dtype      = NULL;
     npy_intp            dims;
     stimage_error_t     error;
 
+    /* SIZE_T_D is only known at import time */
+    const char*    dtype_fields[] = {
+        "input_x", "f8",
+        "input_y", "f8",
+        "input_idx", SIZE_T_D,
+        "ref_x", "f8",
+        "ref_y", "f8",
+        "ref_idx", SIZE_T_D,
+        NULL
+    };
+
     const char*    keywords[]    = {
         "input", "ref", "origin", "mag", "rotation", "ref_origin", "algorithm",
         "tolerance", "separation", "nmatch", "maxratio", "nreject", NULL
@@ -88,7 +100,7 @@ py_xyxymatch(PyObject* self, PyObject* args, PyObject* kwds) {
         return NULL;
     }
 
-    input_array = (PyObject*)PyArray_ContiguousFromAny(
+    input_array = (PyArrayObject*)PyArray_ContiguousFromAny(
             input_obj, NPY_DOUBLE, 2, 2);
     if (input_array == NULL) {
         goto exit;
@@ -98,7 +110,7 @@ py_xyxymatch(PyObject* self, PyObject* args, PyObject* kwds) {
         goto exit;
     }
 
-    ref_array = (PyObject*)PyArray_ContiguousFromAny(
+    ref_array = (PyArrayObject*)PyArray_ContiguousFromAny(
             ref_obj, NPY_DOUBLE, 2, 2);
     if (ref_array == NULL) {
         goto exit;
@@ -133,32 +145,27 @@ py_xyxymatch(PyObject* self, PyObject* args, PyObject* kwds) {
         goto exit;
     }
 
-    dtype_list = Py_BuildValue(
-            "[(ss)(ss)(ss)(ss)(ss)(ss)]",
-            "input_x", "f8",
-            "input_y", "f8",
-            "input_idx", SIZE_T_D,
-            "ref_x", "f8",
-            "ref_y", "f8",
-            "ref_idx", SIZE_T_D);
-    if (dtype_list == NULL) {
+    dtype = get_cached_dtype(&xyxymatch_dtype, dtype_fields);
+    if (dtype == NULL) {
         goto exit;
     }
-    if (!PyArray_DescrConverter(dtype_list, &dtype)) {
-        goto exit;
-    }
-    Py_DECREF(dtype_list);
     dims = (npy_intp)noutput;
     result = PyArray_NewFromDescr(
-            &PyArray_Type, dtype, 1, &dims, NULL, output, NPY_OWNDATA, NULL);
+            &PyArray_Type, dtype, 1, &dims, NULL, output, 0, NULL);
+    if (result == NULL) {
+        goto exit;
+    }
+    if (set_array_base_to_malloced((PyArrayObject*)result, output)) {
+        Py_CLEAR(result);
+    }
+    /* The array owns output now, or it has already been freed */
+    output = NULL;
 
  exit:
 
-    Py_DECREF(input_array);
-    Py_DECREF(ref_array);
-    if (result == NULL) {
-        free(output);
-    }
+    Py_XDECREF(input_array);
+    Py_XDECREF(ref_array);
+    free(output);
 
     return result;
 }
@@ -38,6 +38,7 @@ DAMAGE.
 
 PyObject* py_xyxymatch(PyObject*, PyObject*, PyObject*);
 PyObject* py_geomap(PyObject*, PyObject*, PyObject*);
+int geomap_results_init_type(void);
 
 static PyMethodDef module_methods[] = {
     {"xyxymatch", (PyCFunction)py_xyxymatch, METH_VARARGS | METH_KEYWORDS, NULL},
@@ -72,6 +73,18 @@ init_stimage(void)
 
     SIZE_T_D = sizeof(size_t) == 8 ? "u8" : "u4";
 
+    /* geomap returns instances of this type, but it is not exposed on
+       the module */
+#if PY_MAJOR_VERSION >= 3
+    if (geomap_results_init_type() < 0) {
+        return NULL;
+    }
+#else
+    if (geomap_results_init_type() < 0) {
+        return;
+    }
+#endif
+
 #if PY_MAJOR_VERSION >= 3
     m = PyModule_Create(&moduledef);
 	return m;
@@ -40,19 +40,89 @@ DAMAGE.
 
 char* SIZE_T_D;
 
+PyArray_Descr*
+get_cached_dtype(
+        PyArray_Descr** const cache,
+        const char* const* const fields) {
+
+    PyObject* dtype_list = NULL;
+    PyObject* field      = NULL;
+    size_t    i;
+
+    if (*cache == NULL) {
+        dtype_list = PyList_New(0);
+        if (dtype_list == NULL) {
+            return NULL;
+        }
+
+        for (i = 0; fields[i] != NULL; i += 2) {
+            field = Py_BuildValue("(ss)", fields[i], fields[i+1]);
+            if (field == NULL || PyList_Append(dtype_list, field)) {
+                Py_XDECREF(field);
+                Py_DECREF(dtype_list);
+                return NULL;
+            }
+            Py_DECREF(field);
+        }
+
+        if (!PyArray_DescrConverter(dtype_list, cache)) {
+            *cache = NULL;
+        }
+        Py_DECREF(dtype_list);
+        if (*cache == NULL) {
+            return NULL;
+        }
+    }
+
+    /* The caller gets a new reference, which PyArray_NewFromDescr
+       will steal */
+    Py_INCREF(*cache);
+    return *cache;
+}
+
+static void
+free_capsule(PyObject* capsule) {
+    free(PyCapsule_GetPointer(capsule, NULL));
+}
+
+int
+set_array_base_to_malloced(
+        PyArrayObject* const array,
+        void* const data) {
+
+    PyObject* capsule = NULL;
+
+    if (data == NULL) {
+        return 0;
+    }
+
+    capsule = PyCapsule_New(data, NULL, free_capsule);
+    if (capsule == NULL) {
+        free(data);
+        return -1;
+    }
+
+    /* This steals the reference to capsule, even on failure */
+    if (PyArray_SetBaseObject(array, capsule)) {
+        return -1;
+    }
+
+    return 0;
+}
+
 int
 to_coord_t(
         const char* const name,
         PyObject* o,
         coord_t* const c) {
 
-    PyObject* array = NULL;
+    PyArrayObject* array = NULL;
 
     if (o == NULL || o == Py_None) {
         return 0;
     }
 
-    array = PyArray_FromObject(o, NPY_DOUBLE, 1, 1);
+    array = (PyArrayObject*)PyArray_FromObject(o, NPY_DOUBLE, 1, 1);
     if (array == NULL) {
         return -1;
     }
@@ -79,15 +149,17 @@ from_coord_t(
         const coord_t* const c,
         PyObject** o) {
 
-    npy_intp dims = 2;
+    npy_intp       dims  = 2;
+    PyArrayObject* array = NULL;
 
-    *o = PyArray_SimpleNew(1, &dims, NPY_DOUBLE);
-    if (*o == NULL) {
+    array = (PyArrayObject*)PyArray_SimpleNew(1, &dims, NPY_DOUBLE);
+    if (array == NULL) {
         return -1;
     }
 
-    *((double*)PyArray_GETPTR1(*o, 0)) = c->x;
-    *((double*)PyArray_GETPTR1(*o, 1)) = c->y;
+    *((double*)PyArray_GETPTR1(array, 0)) = c->x;
+    *((double*)PyArray_GETPTR1(array, 1)) = c->y;
+    *o = (PyObject*)array;
 
     return 0;
 }
@@ -98,14 +170,14 @@ to_bbox_t(
         PyObject* o,
         bbox_t* const b) {
 
-    PyObject* array;
+    PyArrayObject* array;
     double* data;
 
     if (o == NULL || o == Py_None) {
         return 0;
     }
 
-    array = PyArray_ContiguousFromAny(o, NPY_DOUBLE, 1, 2);
+    array = (PyArrayObject*)PyArray_ContiguousFromAny(o, NPY_DOUBLE, 1, 2);
     if (array == NULL) {
         return -1;
     }
@@ -38,6 +38,7 @@ DAMAGE.
 #define __STIMAGE_WRAP_UTIL_H__
 
 #define PY_ARRAY_UNIQUE_SYMBOL pywcs_numpy_api
+#define NPY_NO_DEPRECATED_API NPY_1_7_API_VERSION
 
 #include <Python.h>
 #include <numpy/arrayobject.h>
@@ -49,6 +50,39 @@ DAMAGE.
 
 extern char* SIZE_T_D;
 
+/**
+Return a new reference to the record dtype in *cache, building it on
+the first call.  The output dtypes never change, so each wrapper keeps
+one in a static cache.
+
+@param cache Where the dtype is kept between calls
+
+@param fields NULL-terminated list of alternating field names and
+formats
+
+@return NULL on failure, with a Python exception set
+ */
+PyArray_Descr*
+get_cached_dtype(
+        PyArray_Descr** const cache,
+        const char* const* const fields);
+
+/**
+Make a PyCapsule that frees data the base object of array, so the
+buffer is released with the array.
+
+@param array An array viewing data
+
+@param data A buffer allocated with malloc.  It is freed if this
+fails.
+
+@return non-zero on failure, with a Python exception set
+ */
+int
+set_array_base_to_malloced(
+        PyArrayObject* const array,
+        void* const data);
+
 int
 to_coord_t(
         const char* const name,
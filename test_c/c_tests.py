@@ -4,10 +4,13 @@ import sys
 
 TESTS = [
     'cholesky',
+    'fit',
     'geomap',
     'lintransform',
+    'polynomial',
     'surface',
     'triangles',
+    'xybbox',
     'xycoincide',
     'xysort',
     'xyxymatch',
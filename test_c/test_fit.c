@@ -0,0 +1,90 @@
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "surface/surface.h"
+#include "surface/fit.h"
+#include "surface/vector.h"
+
+#define ncoords 200
+
+/* An exact surface of the given order.  The xy term is only present
+   when the cross terms can represent it. */
+static double
+model(const int order, const xterms_e xterms, const double x,
+      const double y) {
+    double z = 3.0 + 0.5 * x - 0.25 * y;
+
+    if (order > 2) {
+        z += 1e-3 * x * x + 2e-3 * y * y;
+    }
+    if ((xterms == xterms_full) ||
+        (xterms == xterms_half && order > 2)) {
+        z += 1e-2 * x * y;
+    }
+    return z;
+}
+
+int main(int argv, char** argc) {
+    coord_t             coord[ncoords];
+    double              z[ncoords];
+    double              w[ncoords];
+    double              zfit[ncoords];
+    bbox_t              bbox;
+    surface_t           surface;
+    surface_fit_error_e fit_error;
+    stimage_error_t     error;
+    int                 type, xterms, order;
+    size_t              i;
+
+    stimage_error_init(&error);
+    srand48(0);
+
+    for (i = 0; i < ncoords; ++i) {
+        coord[i].x = drand48() * 100.0;
+        coord[i].y = drand48() * 50.0 + 10.0;
+    }
+    determine_bbox(ncoords, coord, &bbox);
+
+    for (type = surface_type_polynomial; type < surface_type_LAST; ++type) {
+        for (xterms = xterms_none; xterms <= xterms_full; ++xterms) {
+            for (order = 2; order <= 4; ++order) {
+                for (i = 0; i < ncoords; ++i) {
+                    z[i] = model(order, xterms, coord[i].x, coord[i].y);
+                    w[i] = 1.0;
+                    zfit[i] = 1e30;
+                }
+
+                if (surface_init(
+                            &surface, type, order, order, xterms, &bbox,
+                            &error) ||
+                    surface_fit(
+                            &surface, ncoords, coord, z, w,
+                            surface_fit_weight_user, &fit_error, &error) ||
+                    surface_vector(
+                            &surface, ncoords, coord, zfit, &error)) {
+                    printf("%s\n", stimage_error_get_message(&error));
+                    surface_free(&surface);
+                    return 1;
+                }
+                surface_free(&surface);
+
+                if (fit_error != surface_fit_error_ok) {
+                    printf("type %d xterms %d order %d: fit error %d\n",
+                           type, xterms, order, fit_error);
+                    return 1;
+                }
+
+                for (i = 0; i < ncoords; ++i) {
+                    if (!(fabs(zfit[i] - z[i]) <= 1e-8)) {
+                        printf("type %d xterms %d order %d: %f != %f\n",
+                               type, xterms, order, zfit[i], z[i]);
+                        return 1;
+                    }
+                }
+            }
+        }
+    }
+
+    return 0;
+}
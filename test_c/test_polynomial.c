@@ -0,0 +1,252 @@
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "lib/polynomial.h"
+
+#define ncoords 64
+#define maxcoeff 64
+
+static const double k1x = 0.3;
+static const double k2x = 0.7;
+static const double k1y = -0.2;
+static const double k2y = 0.9;
+
+/* Direct evaluation of a single basis function, for comparison */
+static double
+basis_value(const int type, const int order, const double x,
+            const double k1, const double k2) {
+    double xn, p0, p1, p;
+    int    n;
+
+    if (type == 0) {
+        return pow(x, order);
+    }
+
+    xn = (x + k1) * k2;
+    p0 = 1.0;
+    p1 = xn;
+    if (order == 0) {
+        return p0;
+    }
+    for (n = 2; n <= order; ++n) {
+        if (type == 1) {
+            p = 2.0 * xn * p1 - p0;
+        } else {
+            p = ((2.0 * n - 1.0) * xn * p1 - (n - 1.0) * p0) / n;
+        }
+        p0 = p1;
+        p1 = p;
+    }
+    return p1;
+}
+
+/* Whether the x^k y^j term is part of the surface.  Coefficients are
+   stored row by row in y, so counting the included terms in that
+   order gives each term's coefficient index. */
+static int
+has_term(const xterms_e xterms, const int xorder, const int yorder,
+         const int k, const int j) {
+    int maxorder = xorder > yorder ? xorder : yorder;
+
+    switch (xterms) {
+    case xterms_none:
+        return k == 0 || j == 0;
+    case xterms_half:
+        return k + j <= maxorder - 1;
+    default:
+        return 1;
+    }
+}
+
+static int
+check_2d(const int type, const int xorder, const int yorder,
+         const xterms_e xterms, const coord_t* const data) {
+    double          coeff[maxcoeff];
+    double          zfit[ncoords];
+    double          expected;
+    int             ncoeff, minorder, cp, j, k, status;
+    size_t          i;
+    stimage_error_t error;
+
+    stimage_error_init(&error);
+
+    /* The number of coefficients, as documented for surface_init */
+    minorder = xorder < yorder ? xorder : yorder;
+    switch (xterms) {
+    case xterms_none:
+        ncoeff = xorder + yorder - 1;
+        break;
+    case xterms_half:
+        ncoeff = xorder * yorder - minorder * (minorder - 1) / 2;
+        break;
+    default:
+        ncoeff = xorder * yorder;
+        break;
+    }
+
+    /* Anything read past the end of the coefficients poisons the result */
+    for (i = 0; i < maxcoeff; ++i) {
+        coeff[i] = (int)i < ncoeff ? drand48() - 0.5 : NAN;
+    }
+    for (i = 0; i < ncoords; ++i) {
+        zfit[i] = 1e30;
+    }
+
+    switch (type) {
+    case 0:
+        status = eval_poly(xorder, yorder, coeff, ncoords, data, xterms,
+                           k1x, k2x, k1y, k2y, zfit, &error);
+        break;
+    case 1:
+        status = eval_chebyshev(xorder, yorder, coeff, ncoords, data, xterms,
+                                k1x, k2x, k1y, k2y, zfit, &error);
+        break;
+    default:
+        status = eval_legendre(xorder, yorder, coeff, ncoords, data, xterms,
+                               k1x, k2x, k1y, k2y, zfit, &error);
+        break;
+    }
+    if (status) {
+        printf("%s\n", stimage_error_get_message(&error));
+        return 1;
+    }
+
+    for (i = 0; i < ncoords; ++i) {
+        expected = 0.0;
+        cp = 0;
+        for (j = 0; j < yorder; ++j) {
+            for (k = 0; k < xorder; ++k) {
+                if (has_term(xterms, xorder, yorder, k, j)) {
+                    expected += coeff[cp++] *
+                        basis_value(type, k, data[i].x, k1x, k2x) *
+                        basis_value(type, j, data[i].y, k1y, k2y);
+                }
+            }
+        }
+
+        if (cp != ncoeff) {
+            printf("type %d order %dx%d xterms %d: %d terms, %d coefficients\n",
+                   type, xorder, yorder, xterms, cp, ncoeff);
+            return 1;
+        }
+
+        if (!(fabs(zfit[i] - expected) <= 1e-9)) {
+            printf("type %d order %dx%d xterms %d: %f != %f\n",
+                   type, xorder, yorder, xterms, zfit[i], expected);
+            return 1;
+        }
+    }
+
+    return 0;
+}
+
+static int
+check_1d(const int type, const int order, const size_t axis,
+         const coord_t* const data) {
+    double          coeff[maxcoeff];
+    double          zfit[ncoords];
+    double          expected, x, k1, k2;
+    int             k, status;
+    size_t          i;
+    stimage_error_t error;
+
+    stimage_error_init(&error);
+
+    k1 = axis == 0 ? k1x : k1y;
+    k2 = axis == 0 ? k2x : k2y;
+
+    for (i = 0; i < maxcoeff; ++i) {
+        coeff[i] = (int)i < order ? drand48() - 0.5 : NAN;
+    }
+    for (i = 0; i < ncoords; ++i) {
+        zfit[i] = 1e30;
+    }
+
+    switch (type) {
+    case 0:
+        status = eval_1dpoly(order, coeff, ncoords, axis, data, zfit, &error);
+        break;
+    case 1:
+        status = eval_1dchebyshev(order, coeff, ncoords, axis, data, k1, k2,
+                                  zfit, &error);
+        break;
+    default:
+        status = eval_1dlegendre(order, coeff, ncoords, axis, data, k1, k2,
+                                 zfit, &error);
+        break;
+    }
+    if (status) {
+        printf("%s\n", stimage_error_get_message(&error));
+        return 1;
+    }
+
+    for (i = 0; i < ncoords; ++i) {
+        x = axis == 0 ? data[i].x : data[i].y;
+        expected = 0.0;
+        for (k = 0; k < order; ++k) {
+            expected += coeff[k] * basis_value(type, k, x, k1, k2);
+        }
+
+        if (!(fabs(zfit[i] - expected) <= 1e-9)) {
+            printf("1d type %d order %d axis %d: %f != %f\n",
+                   type, order, (int)axis, zfit[i], expected);
+            return 1;
+        }
+    }
+
+    return 0;
+}
+
+int main(int argv, char** argc) {
+    /* xorder, yorder, xterms */
+    static const int cases[][3] = {
+        {1, 1, xterms_full},
+        {2, 1, xterms_none},
+        {1, 2, xterms_none},
+        {2, 2, xterms_none},
+        {2, 1, xterms_full},
+        {1, 2, xterms_full},
+        {3, 4, xterms_none},
+        {4, 3, xterms_none},
+        {3, 3, xterms_none},
+        {2, 2, xterms_half},
+        {3, 4, xterms_half},
+        {4, 3, xterms_half},
+        {3, 3, xterms_half},
+        {2, 2, xterms_full},
+        {3, 4, xterms_full},
+        {4, 3, xterms_full},
+        {3, 3, xterms_full}
+    };
+    coord_t         data[ncoords];
+    int             type, order;
+    size_t          i, axis;
+
+    srand48(0);
+
+    for (i = 0; i < ncoords; ++i) {
+        data[i].x = drand48() * 4.0 - 2.0;
+        data[i].y = drand48() * 4.0 - 2.0;
+    }
+
+    for (type = 0; type < 3; ++type) {
+        for (i = 0; i < sizeof(cases) / sizeof(cases[0]); ++i) {
+            if (check_2d(type, cases[i][0], cases[i][1], cases[i][2], data)) {
+                return 1;
+            }
+        }
+    }
+
+    for (type = 0; type < 3; ++type) {
+        for (order = 1; order <= 6; ++order) {
+            for (axis = 0; axis < 2; ++axis) {
+                if (check_1d(type, order, axis, data)) {
+                    return 1;
+                }
+            }
+        }
+    }
+
+    return 0;
+}
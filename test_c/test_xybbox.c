@@ -0,0 +1,57 @@
+#include <math.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+#include "lib/xybbox.h"
+
+int main(int argv, char** argc) {
+    #define ncoords 6
+    coord_t input[ncoords];
+    coord_t ref[ncoords];
+    coord_t input_in_bbox[ncoords];
+    coord_t ref_in_bbox[ncoords];
+    bbox_t  bbox;
+    size_t  nout = 0;
+    size_t  i = 0;
+    int     unset = 0;
+
+    ref[0].x = 0.0;        ref[0].y = 0.0;       /* inside */
+    ref[1].x = -HUGE_VAL;  ref[1].y = 0.0;       /* inside, on an unset side */
+    ref[2].x = 0.0;        ref[2].y = -HUGE_VAL; /* inside, on an unset side */
+    ref[3].x = 11.0;       ref[3].y = 0.0;       /* outside */
+    ref[4].x = 0.0;        ref[4].y = HUGE_VAL;  /* outside */
+    ref[5].x = 10.0;       ref[5].y = 10.0;      /* on the edge */
+
+    for (i = 0; i < ncoords; ++i) {
+        input[i].x = (double)i;
+        input[i].y = (double)i;
+    }
+
+    /* Only the max sides are set.  NaN and infinite sides both count
+       as unset. */
+    for (unset = 0; unset < 2; ++unset) {
+        bbox_init(&bbox);
+        if (unset) {
+            bbox.min.x = -HUGE_VAL;
+            bbox.min.y = -HUGE_VAL;
+        }
+        bbox.max.x = 10.0;
+        bbox.max.y = 10.0;
+
+        nout = limit_to_bbox(
+                ncoords, input, ref, &bbox, input_in_bbox, ref_in_bbox);
+
+        if (nout != 4) {
+            printf("%lu coordinates in bbox, expected 4\n",
+                   (unsigned long)nout);
+            return 1;
+        }
+
+        if (input_in_bbox[0].x != 0.0 || input_in_bbox[1].x != 1.0 ||
+            input_in_bbox[2].x != 2.0 || input_in_bbox[3].x != 5.0) {
+            return 1;
+        }
+    }
+
+    return 0;
+}